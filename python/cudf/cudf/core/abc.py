@@ -1,8 +1,10 @@
-# Copyright (c) 2020-2021, NVIDIA CORPORATION.
+# Copyright (c) 2020-2022, NVIDIA CORPORATION.
 """Common abstract base classes for cudf."""
 
 import sys
 
+import numpy as np
+
 import rmm
 
 import cudf
@@ -30,6 +32,10 @@ class Serializable:
     latter converts back from that representation into an equivalent object.
     """
 
+    # Empty slots so that subclasses which declare their own ``__slots__``
+    # (such as Buffer) do not get an instance ``__dict__`` from this base.
+    __slots__ = ()
+
     def serialize(self):
         """Generate an equivalent serializable representation of an object.
 
@@ -157,11 +163,24 @@ class Serializable:
         """
         header, frames = self.device_serialize()
         header["writeable"] = len(frames) * (None,)
-        frames = [
-            f.to_host_array().data if c else memoryview(f)
-            for c, f in zip(header["is-cuda"], frames)
-        ]
-        return header, frames
+        # Copy all device frames into slices of a single host allocation
+        # instead of allocating a separate host array for each frame.
+        host_data = np.empty(
+            sum(f.nbytes for c, f in zip(header["is-cuda"], frames) if c),
+            dtype="u1",
+        )
+        host_frames = []
+        offset = 0
+        for c, f in zip(header["is-cuda"], frames):
+            if c:
+                view = host_data[offset : offset + f.nbytes]
+                if f.nbytes > 0:
+                    rmm._lib.device_buffer.copy_ptr_to_host(f.ptr, view)
+                offset += f.nbytes
+                host_frames.append(view.data)
+            else:
+                host_frames.append(memoryview(f))
+        return header, host_frames
 
     @classmethod
     def host_deserialize(cls, header, frames):
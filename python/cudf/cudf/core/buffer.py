@@ -33,6 +33,8 @@ class Buffer(Serializable):
         object is kept in this Buffer.
     """
 
+    __slots__ = ("_ptr", "_size", "_owner")
+
     _ptr: int
     _size: int
     _owner: object
@@ -56,3 +56,10 @@ def test_buffer_copy(size):
     if size > 0:
         assert got.ptr != buf.ptr
     assert_array_equal(cp.asarray(buf), cp.asarray(got))
+
+
+def test_buffer_has_no_instance_dict():
+    buf = Buffer(data=cp.zeros(arr_len, dtype="u1"))
+    assert not hasattr(buf, "__dict__")
+    with pytest.raises(AttributeError):
+        buf.foo = 1
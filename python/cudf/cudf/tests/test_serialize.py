@@ -362,3 +362,14 @@ def test_serialize_sliced_string():
 
     recreated = cudf.Series.deserialize(*sliced.serialize())
     assert_eq(recreated.to_pandas(nullable=True), pd_series)
+
+
+def test_host_serialize_single_host_allocation():
+    df = cudf.DataFrame({"a": [1, None, 3], "b": [4.0, 5.0, 6.0]})
+    header, frames = df.host_serialize()
+    assert sum(header["is-cuda"]) > 1
+    bases = {
+        id(f.obj.base) for c, f in zip(header["is-cuda"], frames) if c
+    }
+    assert len(bases) == 1
+    assert_eq(df, cudf.DataFrame.host_deserialize(header, frames))